@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sys
+import time
 from pathlib import Path
 from typing import Callable
 
@@ -12,12 +14,19 @@ from .organizer import organize_files, organize_sidecar_files
 from .scanner import scan_music
 
 
+PROGRESS_MIN_INTERVAL_SECONDS = 0.2
+
+
 def _make_progress_printer(stage: str) -> Callable[[int, int], None]:
     is_tty = sys.stdout.isatty()
     last_percent = -1
+    last_printed_at = float("-inf")
 
     def _report(current: int, total: int) -> None:
-        nonlocal last_percent
+        nonlocal last_percent, last_printed_at
+        now = time.monotonic()
+        if current < total and now - last_printed_at < PROGRESS_MIN_INTERVAL_SECONDS:
+            return
         percent = 100 if total <= 0 else int((current / total) * 100)
         percent = max(0, min(100, percent))
 
@@ -27,6 +36,7 @@ def _make_progress_printer(stage: str) -> Callable[[int, int], None]:
             end = "\n" if current >= total else ""
             print(f"\r[{stage}] {percent:3d}% ({current}/{total})", end=end, flush=True)
             last_percent = percent
+            last_printed_at = now
             return
 
         should_print = (
@@ -37,6 +47,7 @@ def _make_progress_printer(stage: str) -> Callable[[int, int], None]:
         if should_print:
             print(f"[{stage}] {percent:3d}% ({current}/{total})")
             last_percent = percent
+            last_printed_at = now
 
     return _report
 
@@ -85,6 +96,17 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Copy files instead of moving when organizing",
     )
+    parser.add_argument(
+        "--preserve-metadata",
+        action="store_true",
+        help="With --copy, also copy permissions, flags and extended attributes (default: timestamps only)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for reading audio metadata during scan (1 disables parallelism)",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -116,7 +138,12 @@ def build_parser() -> argparse.ArgumentParser:
         "--musicbrainz-sleep-seconds",
         type=float,
         default=1.1,
-        help="Delay between MusicBrainz requests to stay within public rate limits",
+        help="Minimum seconds between MusicBrainz request starts to stay within public rate limits",
+    )
+    parser.add_argument(
+        "--no-musicbrainz-cache",
+        action="store_true",
+        help="Always query MusicBrainz instead of reusing results cached in the output directory",
     )
     parser.add_argument(
         "--write-tags",
@@ -135,6 +162,8 @@ def main() -> None:
 
     if not root.exists() or not root.is_dir():
         raise SystemExit(f"Root directory does not exist or is not a directory: {root}")
+    if args.jobs < 1:
+        raise SystemExit("--jobs must be at least 1")
 
     if args.organize_sidecars_only:
         destination_root = (args.dest_root or root).expanduser().resolve()
@@ -151,6 +180,7 @@ def main() -> None:
             copy_instead_of_move=args.copy,
             verbose=args.verbose,
             progress_callback=_make_progress_printer("sidecar"),
+            preserve_metadata=args.preserve_metadata,
         )
         print(f"[sidecar] sidecar files moved/copied: {sidecar_result.sidecar_moved}")
         if sidecar_result.warnings:
@@ -166,6 +196,7 @@ def main() -> None:
         root,
         verbose=args.verbose,
         progress_callback=_make_progress_printer("scan"),
+        jobs=args.jobs,
     )
     records = scan_result.records
 
@@ -183,6 +214,7 @@ def main() -> None:
                 write_tags=args.write_tags,
                 verbose=args.verbose,
                 progress_callback=_make_progress_printer("enrich"),
+                cache_path=None if args.no_musicbrainz_cache else output_dir / "mb_cache.sqlite",
             )
         except RuntimeError as exc:
             raise SystemExit(str(exc))
@@ -236,6 +268,7 @@ def main() -> None:
             copy_instead_of_move=args.copy,
             verbose=args.verbose,
             progress_callback=_make_progress_printer("organize"),
+            preserve_metadata=args.preserve_metadata,
         )
         print(f"[organize] planned/performed file operations: {organize_result.moved}")
         print(f"[organize] skipped (already in place): {organize_result.skipped}")
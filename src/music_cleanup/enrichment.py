@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import json
+import queue
+import sqlite3
 import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Callable, Optional
 
 from .metadata import normalized_album, normalized_artist, normalized_title, write_audio_tags
@@ -12,6 +17,10 @@ except ModuleNotFoundError:  # pragma: no cover - depends on local env
     musicbrainzngs = None
 
 
+TAG_WRITER_WORKERS = 4
+TAG_QUEUE_SIZE = 64
+
+
 def _strip_year(date_value: str) -> str:
     if not date_value:
         return ""
@@ -31,8 +40,7 @@ def _result_score(item: dict) -> int:
 def _extract_best_candidate(recordings: list[dict]) -> Optional[dict]:
     if not recordings:
         return None
-    ranked = sorted(recordings, key=_result_score, reverse=True)
-    return ranked[0]
+    return max(recordings, key=_result_score)
 
 
 def _release_title(candidate: dict) -> str:
@@ -67,6 +75,56 @@ def _needs_enrichment(record: TrackRecord, missing_only: bool) -> bool:
     return missing_artist or missing_album
 
 
+def _open_query_cache(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE IF NOT EXISTS mb_cache (key TEXT PRIMARY KEY, candidate TEXT, ts INTEGER)")
+    return conn
+
+
+def _cached_candidate(conn: sqlite3.Connection, key: str) -> tuple[bool, Optional[dict]]:
+    row = conn.execute("SELECT candidate FROM mb_cache WHERE key = ?", (key,)).fetchone()
+    if row is None:
+        return False, None
+    return True, json.loads(row[0])
+
+
+def _store_candidate(conn: sqlite3.Connection, key: str, candidate: Optional[dict]) -> None:
+    # Misses are cached too, so unmatched queries aren't retried on every run.
+    conn.execute(
+        "INSERT OR REPLACE INTO mb_cache (key, candidate, ts) VALUES (?, ?, ?)",
+        (key, json.dumps(candidate), int(time.time())),
+    )
+    conn.commit()
+
+
+def _tag_writer(tag_queue: queue.Queue) -> int:
+    written = 0
+    while True:
+        item = tag_queue.get()
+        try:
+            if item is None:
+                return written
+            if write_audio_tags(*item):
+                written += 1
+        finally:
+            tag_queue.task_done()
+
+
+def _make_request_throttle(interval_seconds: float) -> Callable[[], None]:
+    last_request_at: float | None = None
+
+    def _wait() -> None:
+        nonlocal last_request_at
+        if last_request_at is not None:
+            remaining = interval_seconds - (time.monotonic() - last_request_at)
+            if remaining > 0:
+                time.sleep(remaining)
+        last_request_at = time.monotonic()
+
+    return _wait
+
+
 def enrich_with_musicbrainz(
     records: list[TrackRecord],
     app_name: str,
@@ -78,6 +136,7 @@ def enrich_with_musicbrainz(
     write_tags: bool = False,
     verbose: bool = False,
     progress_callback: Callable[[int, int], None] | None = None,
+    cache_path: Path | None = None,
 ) -> tuple[int, int, int, int]:
     if musicbrainzngs is None:
         raise RuntimeError("musicbrainzngs is not installed. Run: pip install musicbrainzngs")
@@ -89,98 +148,115 @@ def enrich_with_musicbrainz(
     checked = 0
     tags_written = 0
 
+    wait_for_request_slot = _make_request_throttle(sleep_seconds)
     candidates = [record for record in records if _needs_enrichment(record, missing_only=missing_only)]
     total_candidates = len(candidates)
     if progress_callback:
         progress_callback(0, total_candidates)
 
-    for idx, record in enumerate(candidates, start=1):
-
-        checked += 1
-
-        query_artist = "" if record.artist == "Unknown Artist" else record.artist
-        query_title = normalized_title(record.title, record.file_path.stem)
-
-        if not query_title:
-            unmatched += 1
-            if progress_callback:
-                progress_callback(idx, total_candidates)
-            continue
-
-        try:
-            response = musicbrainzngs.search_recordings(
-                recording=query_title,
-                artist=query_artist if query_artist else None,
-                limit=5,
+    cache = _open_query_cache(cache_path) if cache_path is not None else None
+    tag_queue: queue.Queue = queue.Queue(maxsize=TAG_QUEUE_SIZE)
+    tag_executor = ThreadPoolExecutor(max_workers=TAG_WRITER_WORKERS) if write_tags else None
+    tag_writers = [tag_executor.submit(_tag_writer, tag_queue) for _ in range(TAG_WRITER_WORKERS)] if tag_executor else []
+    try:
+        for idx, record in enumerate(candidates, start=1):
+
+            checked += 1
+
+            query_artist = "" if record.artist == "Unknown Artist" else record.artist
+            query_title = normalized_title(record.title, record.file_path.stem)
+
+            if not query_title:
+                unmatched += 1
+                if progress_callback:
+                    progress_callback(idx, total_candidates)
+                continue
+
+            cache_key = json.dumps([query_artist, query_title])
+            cached, candidate = _cached_candidate(cache, cache_key) if cache is not None else (False, None)
+            if not cached:
+                wait_for_request_slot()
+                try:
+                    response = musicbrainzngs.search_recordings(
+                        recording=query_title,
+                        artist=query_artist if query_artist else None,
+                        limit=5,
+                    )
+                except Exception as exc:  # pragma: no cover - network dependent
+                    if verbose:
+                        print(f"[enrich] query failed for {record.relative_path}: {exc}")
+                    unmatched += 1
+                    if progress_callback:
+                        progress_callback(idx, total_candidates)
+                    continue
+
+                recordings = response.get("recording-list", [])
+                candidate = _extract_best_candidate(recordings)
+                if cache is not None:
+                    _store_candidate(cache, cache_key, candidate)
+
+            if not candidate:
+                unmatched += 1
+                if progress_callback:
+                    progress_callback(idx, total_candidates)
+                continue
+
+            score = _result_score(candidate)
+            if score < min_score:
+                unmatched += 1
+                if verbose:
+                    print(f"[enrich] low score {score} for {record.relative_path}")
+                if progress_callback:
+                    progress_callback(idx, total_candidates)
+                continue
+
+            new_artist = normalized_artist(_artist_name(candidate) or record.artist)
+            new_album = normalized_album(_release_title(candidate) or record.album)
+            new_title = normalized_title(_recording_title(candidate) or record.title, record.file_path.stem)
+            new_year = _recording_year(candidate) or record.year
+
+            changed = (
+                new_artist != record.artist
+                or new_album != record.album
+                or new_title != record.title
+                or new_year != record.year
             )
-        except Exception as exc:  # pragma: no cover - network dependent
-            if verbose:
-                print(f"[enrich] query failed for {record.relative_path}: {exc}")
-            unmatched += 1
-            time.sleep(sleep_seconds)
-            if progress_callback:
-                progress_callback(idx, total_candidates)
-            continue
 
-        recordings = response.get("recording-list", [])
-        candidate = _extract_best_candidate(recordings)
-        if not candidate:
-            unmatched += 1
-            time.sleep(sleep_seconds)
-            if progress_callback:
-                progress_callback(idx, total_candidates)
-            continue
-
-        score = _result_score(candidate)
-        if score < min_score:
-            unmatched += 1
-            if verbose:
-                print(f"[enrich] low score {score} for {record.relative_path}")
-            time.sleep(sleep_seconds)
+            if changed:
+                if verbose:
+                    print(
+                        f"[enrich] {record.relative_path}: "
+                        f"artist='{record.artist}' -> '{new_artist}', "
+                        f"album='{record.album}' -> '{new_album}'"
+                    )
+                record.artist = new_artist
+                record.album = new_album
+                record.title = new_title
+                record.year = new_year
+                record.metadata_source = "musicbrainz"
+                updated += 1
+                if write_tags:
+                    tag_queue.put(
+                        (
+                            record.file_path,
+                            record.artist,
+                            record.album,
+                            record.title,
+                            record.track_number,
+                            record.year,
+                            record.genre,
+                        )
+                    )
+
             if progress_callback:
                 progress_callback(idx, total_candidates)
-            continue
-
-        new_artist = normalized_artist(_artist_name(candidate) or record.artist)
-        new_album = normalized_album(_release_title(candidate) or record.album)
-        new_title = normalized_title(_recording_title(candidate) or record.title, record.file_path.stem)
-        new_year = _recording_year(candidate) or record.year
-
-        changed = (
-            new_artist != record.artist
-            or new_album != record.album
-            or new_title != record.title
-            or new_year != record.year
-        )
-
-        if changed:
-            if verbose:
-                print(
-                    f"[enrich] {record.relative_path}: "
-                    f"artist='{record.artist}' -> '{new_artist}', "
-                    f"album='{record.album}' -> '{new_album}'"
-                )
-            record.artist = new_artist
-            record.album = new_album
-            record.title = new_title
-            record.year = new_year
-            record.metadata_source = "musicbrainz"
-            updated += 1
-            if write_tags:
-                saved = write_audio_tags(
-                    record.file_path,
-                    artist=record.artist,
-                    album=record.album,
-                    title=record.title,
-                    track_number=record.track_number,
-                    year=record.year,
-                    genre=record.genre,
-                )
-                if saved:
-                    tags_written += 1
-
-        time.sleep(sleep_seconds)
-        if progress_callback:
-            progress_callback(idx, total_candidates)
+    finally:
+        if cache is not None:
+            cache.close()
+        if tag_executor is not None:
+            for _ in tag_writers:
+                tag_queue.put(None)
+            tags_written = sum(writer.result() for writer in tag_writers)
+            tag_executor.shutdown()
 
     return checked, updated, unmatched, tags_written
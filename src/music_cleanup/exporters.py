@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import csv
+import os
 import sqlite3
 from pathlib import Path
 
@@ -26,35 +27,66 @@ TRACK_COLUMNS = [
 ]
 
 
+CSV_BUFFER_SIZE = 1 << 20
+
+TRACK_INSERT_SQL = """
+    INSERT INTO tracks (
+        file_path, relative_path, size_bytes, format_ext, artist, album, title,
+        track_number, year, genre, duration_seconds, bitrate_kbps, sample_rate_hz, metadata_source
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+# _track_row and _track_csv_row both follow TRACK_COLUMNS order; change them together.
+def _track_row(r: TrackRecord) -> tuple:
+    return (
+        str(r.file_path),
+        r.relative_path,
+        r.size_bytes,
+        r.format_ext,
+        r.artist,
+        r.album,
+        r.title,
+        r.track_number,
+        r.year,
+        r.genre,
+        r.duration_seconds,
+        r.bitrate_kbps,
+        r.sample_rate_hz,
+        r.metadata_source,
+    )
+
+
+def _track_csv_row(r: TrackRecord) -> tuple:
+    return (
+        str(r.file_path),
+        r.relative_path,
+        round(r.size_bytes / 1048576, 2),
+        r.format_ext,
+        r.artist,
+        r.album,
+        r.title,
+        r.track_number,
+        r.year,
+        r.genre,
+        r.duration_seconds,
+        r.bitrate_kbps,
+        r.sample_rate_hz,
+        r.metadata_source,
+    )
+
+
 def export_tracks_csv(path: Path, records: list[TrackRecord]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=TRACK_COLUMNS)
-        writer.writeheader()
-        for r in records:
-            writer.writerow(
-                {
-                    "file_path": str(r.file_path),
-                    "relative_path": r.relative_path,
-                    "size_mb": round(bytes_to_mb(r.size_bytes), 2),
-                    "format_ext": r.format_ext,
-                    "artist": r.artist,
-                    "album": r.album,
-                    "title": r.title,
-                    "track_number": r.track_number,
-                    "year": r.year,
-                    "genre": r.genre,
-                    "duration_seconds": r.duration_seconds,
-                    "bitrate_kbps": r.bitrate_kbps,
-                    "sample_rate_hz": r.sample_rate_hz,
-                    "metadata_source": r.metadata_source,
-                }
-            )
+    with path.open("w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(TRACK_COLUMNS)
+        writer.writerows(map(_track_csv_row, records))
 
 
 def export_metrics_csv(path: Path, metrics: LibraryMetrics, format_percent: dict[str, float], format_bytes: dict[str, int]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8") as f:
+    with path.open("w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
         writer = csv.writer(f)
         writer.writerow(["metric", "value"])
         writer.writerow(["total_tracks", metrics.total_tracks])
@@ -69,12 +101,19 @@ def export_metrics_csv(path: Path, metrics: LibraryMetrics, format_percent: dict
 
 def export_sqlite(path: Path, records: list[TrackRecord], metrics: LibraryMetrics, format_percent: dict[str, float], format_bytes: dict[str, int]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(path)
+    # Build into a fresh side file and swap it in, so a crash mid-export never touches the
+    # existing catalog; that is what makes skipping fsyncs and the on-disk journal safe.
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.unlink(missing_ok=True)
+    conn = sqlite3.connect(tmp_path)
     try:
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA journal_mode=MEMORY")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+
         cur = conn.cursor()
-        cur.execute("DROP TABLE IF EXISTS tracks")
-        cur.execute("DROP TABLE IF EXISTS library_metrics")
-        cur.execute("DROP TABLE IF EXISTS format_metrics")
+        cur.execute("BEGIN")
 
         cur.execute(
             """
@@ -119,33 +158,7 @@ def export_sqlite(path: Path, records: list[TrackRecord], metrics: LibraryMetric
             """
         )
 
-        cur.executemany(
-            """
-            INSERT INTO tracks (
-                file_path, relative_path, size_bytes, format_ext, artist, album, title,
-                track_number, year, genre, duration_seconds, bitrate_kbps, sample_rate_hz, metadata_source
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                (
-                    str(r.file_path),
-                    r.relative_path,
-                    r.size_bytes,
-                    r.format_ext,
-                    r.artist,
-                    r.album,
-                    r.title,
-                    r.track_number,
-                    r.year,
-                    r.genre,
-                    r.duration_seconds,
-                    r.bitrate_kbps,
-                    r.sample_rate_hz,
-                    r.metadata_source,
-                )
-                for r in records
-            ],
-        )
+        cur.executemany(TRACK_INSERT_SQL, map(_track_row, records))
 
         cur.execute(
             "INSERT INTO library_metrics VALUES (?, ?, ?, ?)",
@@ -154,9 +167,10 @@ def export_sqlite(path: Path, records: list[TrackRecord], metrics: LibraryMetric
 
         cur.executemany(
             "INSERT INTO format_metrics VALUES (?, ?, ?)",
-            [(fmt, format_bytes.get(fmt, 0), format_percent[fmt]) for fmt in sorted(format_percent)],
+            ((fmt, format_bytes.get(fmt, 0), format_percent[fmt]) for fmt in sorted(format_percent)),
         )
 
         conn.commit()
     finally:
         conn.close()
+    os.replace(tmp_path, path)
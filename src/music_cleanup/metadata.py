@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 try:
@@ -8,7 +9,7 @@ except ModuleNotFoundError:  # pragma: no cover - depends on local env
     File = None
 
 
-AUDIO_EXTENSIONS = {
+AUDIO_EXTENSIONS = frozenset({
     ".mp3",
     ".flac",
     ".wav",
@@ -19,14 +20,25 @@ AUDIO_EXTENSIONS = {
     ".wma",
     ".aiff",
     ".alac",
-}
+})
 
+ARTIST_KEYS = ("artist", "albumartist", "ARTIST", "TPE1", "\u00a9ART")
+ALBUM_KEYS = ("album", "ALBUM", "TALB", "\u00a9alb")
+TITLE_KEYS = ("title", "TITLE", "TIT2", "\u00a9nam")
+TRACK_NUMBER_KEYS = ("tracknumber", "TRACKNUMBER", "TRCK", "trkn")
+YEAR_KEYS = ("date", "year", "DATE", "TDRC", "\u00a9day")
+GENRE_KEYS = ("genre", "GENRE", "TCON", "\u00a9gen")
 
-def is_audio_file(path: Path) -> bool:
+
+def is_audio_name(name: str) -> bool:
     # macOS AppleDouble sidecar files (._*) are metadata blobs, not audio.
-    if path.name.startswith("._"):
+    if name.startswith("._"):
         return False
-    return path.is_file() and path.suffix.lower() in AUDIO_EXTENSIONS
+    return os.path.splitext(name)[1].lower() in AUDIO_EXTENSIONS
+
+
+def is_audio_file(path: Path) -> bool:
+    return is_audio_name(path.name) and path.is_file()
 
 
 def _first(value: object) -> str:
@@ -39,16 +51,19 @@ def _first(value: object) -> str:
     return str(value).strip()
 
 
-def _tag_value(tags: object, *keys: str) -> str:
+def _tag_value(tags: object, keys: tuple[str, ...]) -> str:
     if tags is None:
         return ""
 
+    get = getattr(tags, "get", None)
+    if get is None:
+        return ""
+
     for key in keys:
-        value = None
         try:
-            value = tags.get(key)
+            value = get(key)
         except Exception:
-            value = None
+            continue
         if value:
             return _first(value)
 
@@ -107,12 +122,12 @@ def read_audio_info(path: Path) -> dict[str, object]:
 
     tags = getattr(audio, "tags", None)
 
-    artist = _tag_value(tags, "artist", "albumartist", "ARTIST", "TPE1", "\u00a9ART")
-    album = _tag_value(tags, "album", "ALBUM", "TALB", "\u00a9alb")
-    title = _tag_value(tags, "title", "TITLE", "TIT2", "\u00a9nam")
-    track_number = _tag_value(tags, "tracknumber", "TRACKNUMBER", "TRCK", "trkn")
-    year = _tag_value(tags, "date", "year", "DATE", "TDRC", "\u00a9day")
-    genre = _tag_value(tags, "genre", "GENRE", "TCON", "\u00a9gen")
+    artist = _tag_value(tags, ARTIST_KEYS)
+    album = _tag_value(tags, ALBUM_KEYS)
+    title = _tag_value(tags, TITLE_KEYS)
+    track_number = _tag_value(tags, TRACK_NUMBER_KEYS)
+    year = _tag_value(tags, YEAR_KEYS)
+    genre = _tag_value(tags, GENRE_KEYS)
 
     return {
         "artist": artist,
@@ -1,24 +1,32 @@
 from __future__ import annotations
 
-from collections import Counter
-
 from .models import LibraryMetrics, TrackRecord
 
 
 def summarize(records: list[TrackRecord]) -> tuple[LibraryMetrics, dict[str, float], dict[str, int]]:
     total_tracks = len(records)
-    total_size_bytes = sum(r.size_bytes for r in records)
-    unique_artists = len({r.artist for r in records})
-    unique_albums = len({(r.artist, r.album) for r in records})
-
-    format_bytes = Counter()
+    total_size_bytes = 0
+    artists: set[str] = set()
+    albums: set[tuple[str, str]] = set()
+    format_bytes: dict[str, int] = {}
+    add_artist = artists.add
+    add_album = albums.add
+    format_size = format_bytes.get
     for r in records:
-        format_bytes[r.format_ext] += r.size_bytes
-
-    format_percent: dict[str, float] = {}
-    for fmt, size in sorted(format_bytes.items()):
-        pct = (size / total_size_bytes * 100.0) if total_size_bytes else 0.0
-        format_percent[fmt] = round(pct, 2)
+        size = r.size_bytes
+        artist = r.artist
+        total_size_bytes += size
+        add_artist(artist)
+        add_album((artist, r.album))
+        ext = r.format_ext
+        format_bytes[ext] = format_size(ext, 0) + size
+    unique_artists = len(artists)
+    unique_albums = len(albums)
+
+    format_percent: dict[str, float] = {
+        fmt: round(size / total_size_bytes * 100.0, 2) if total_size_bytes else 0.0
+        for fmt, size in sorted(format_bytes.items())
+    }
 
     return (
         LibraryMetrics(
@@ -28,7 +36,7 @@ def summarize(records: list[TrackRecord]) -> tuple[LibraryMetrics, dict[str, flo
             unique_albums=unique_albums,
         ),
         format_percent,
-        dict(format_bytes),
+        format_bytes,
     )
 
 
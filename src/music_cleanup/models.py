@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class TrackRecord:
     file_path: Path
     relative_path: str
@@ -23,7 +26,7 @@ class TrackRecord:
     metadata_source: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LibraryMetrics:
     total_tracks: int
     total_size_bytes: int
@@ -31,13 +34,13 @@ class LibraryMetrics:
     unique_albums: int
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScanResult:
     records: list[TrackRecord]
     warnings: list[str]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class OrganizeResult:
     moved: int
     skipped: int
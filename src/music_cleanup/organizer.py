@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import errno
+import functools
 import os
 import re
 import shutil
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Callable
 
 from .models import OrganizeResult, TrackRecord
+from .progress import throttle_progress
 
 
-INVALID_CHARS = re.compile(r"[<>:\"/\\|?*\x00-\x1F]")
-SIDECAR_EXTENSIONS = {
+INVALID_CHARS_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*' + "".join(chr(i) for i in range(32))})
+COPY_WORKERS = 8
+TRAILING_TAGS_PATTERN = re.compile(r"(?:\s*(?:\([^)]*\)|\[[^\]]*\]))+\s*$")
+SIDECAR_EXTENSIONS = frozenset({
     ".jpg",
     ".jpeg",
     ".png",
@@ -26,23 +32,26 @@ SIDECAR_EXTENSIONS = {
     ".m3u",
     ".m3u8",
     ".pdf",
-}
+})
 
 
+@functools.lru_cache(maxsize=8192)
 def sanitize_name(value: str) -> str:
-    value = value.strip().rstrip(".")
-    value = INVALID_CHARS.sub("_", value)
+    value = value.strip().rstrip(".").translate(INVALID_CHARS_TABLE)
     return value if value else "Unknown"
 
 
+@functools.lru_cache(maxsize=4096)
+def _album_dir_for(destination_root: Path, artist: str, album: str) -> Path:
+    return destination_root / sanitize_name(artist) / sanitize_name(album if album else "Miscellaneous")
+
+
 def target_path_for(record: TrackRecord, destination_root: Path) -> Path:
-    artist = sanitize_name(record.artist)
-    album = sanitize_name(record.album if record.album else "Miscellaneous")
-    return destination_root / artist / album / record.file_path.name
+    return _album_dir_for(destination_root, record.artist, record.album) / record.file_path.name
 
 
-def _non_colliding_path(path: Path) -> Path:
-    if not path.exists():
+def _non_colliding_path(path: Path, taken: set[Path] | None = None) -> Path:
+    if (taken is None or path not in taken) and not path.exists():
         return path
     stem = path.stem
     suffix = path.suffix
@@ -50,37 +59,66 @@ def _non_colliding_path(path: Path) -> Path:
     counter = 1
     while True:
         candidate = parent / f"{stem} ({counter}){suffix}"
-        if not candidate.exists():
+        if (taken is None or candidate not in taken) and not candidate.exists():
             return candidate
         counter += 1
 
 
-def _is_sidecar_file(path: Path) -> bool:
-    if not path.is_file():
-        return False
-    if path.name.startswith("._"):
+def _copy_file(source: Path, target: Path, preserve_metadata: bool) -> None:
+    if preserve_metadata:
+        shutil.copy2(source, target)
+        return
+    st = os.stat(source)
+    shutil.copyfile(source, target)
+    os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _device_of(directory: Path, devices: dict[Path, int]) -> int:
+    device = devices.get(directory)
+    if device is None:
+        device = os.stat(directory).st_dev
+        devices[directory] = device
+    return device
+
+
+def _move_file(source: Path, target: Path, devices: dict[Path, int]) -> None:
+    if _device_of(source.parent, devices) == _device_of(target.parent, devices):
+        # A shared st_dev does not guarantee rename works (e.g. bind mounts), so fall back on EXDEV.
+        try:
+            os.replace(source, target)
+            return
+        except OSError as exc:
+            if exc.errno != errno.EXDEV:
+                raise
+    shutil.move(str(source), str(target))
+
+
+def _is_sidecar_name(name: str) -> bool:
+    if name.startswith("._"):
         return False
-    return path.suffix.lower() in SIDECAR_EXTENSIONS
+    return os.path.splitext(name)[1].lower() in SIDECAR_EXTENSIONS
+
+
+def _is_sidecar_file(path: Path) -> bool:
+    return _is_sidecar_name(path.name) and path.is_file()
 
 
 def _clean_album_dir_name(value: str) -> str:
-    cleaned = value.strip()
-    while True:
-        next_cleaned = re.sub(r"\s*(\([^)]*\)|\[[^\]]*\])\s*$", "", cleaned).strip()
-        if next_cleaned == cleaned:
-            break
-        cleaned = next_cleaned
-    return cleaned
+    return TRAILING_TAGS_PATTERN.sub("", value.strip()).strip()
 
 
 def _infer_scan_root(records: list[TrackRecord]) -> Path | None:
     for record in records:
-        rel_parts = Path(record.relative_path).parts
-        if not rel_parts:
+        rel = record.relative_path
+        if not rel:
+            continue
+        full = str(record.file_path)
+        if not full.endswith(rel):
             continue
-        idx = len(rel_parts) - 1
-        if idx < len(record.file_path.parents):
-            return record.file_path.parents[idx]
+        prefix = full[: -len(rel)]
+        if not prefix.endswith(os.sep):
+            continue
+        return Path(prefix)
     return None
 
 
@@ -105,25 +143,31 @@ def _collect_sidecar_files(
 ) -> dict[Path, list[Path]]:
     sidecar_files_by_dir: dict[Path, list[Path]] = defaultdict(list)
 
-    def _on_walk_error(err: OSError) -> None:
-        target = getattr(err, "filename", None) or str(root)
-        warnings.append(f"organize sidecar walk error: {target}: {err.strerror or str(err)}")
-        if verbose:
-            print(f"[organize-warning] sidecar walk error: {target}: {err.strerror or str(err)}")
+    if root == destination_root or destination_root in root.parents:
+        return sidecar_files_by_dir
 
-    for dirpath, _, filenames in os.walk(root, onerror=_on_walk_error):
-        current = Path(dirpath)
-        if current == destination_root or destination_root in current.parents:
-            continue
-        for name in filenames:
-            candidate = current / name
-            try:
-                if _is_sidecar_file(candidate):
-                    sidecar_files_by_dir[current].append(candidate)
-            except (FileNotFoundError, NotADirectoryError, PermissionError, OSError) as exc:
-                warnings.append(f"organize sidecar skipped: {candidate}: {exc}")
-                if verbose:
-                    print(f"[organize-warning] sidecar skipped: {candidate}: {exc}")
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdir = Path(entry.path)
+                            if subdir != destination_root:
+                                stack.append(subdir)
+                        elif _is_sidecar_name(entry.name) and entry.is_file():
+                            sidecar_files_by_dir[current].append(Path(entry.path))
+                    except (FileNotFoundError, NotADirectoryError, PermissionError, OSError) as exc:
+                        warnings.append(f"organize sidecar skipped: {entry.path}: {exc}")
+                        if verbose:
+                            print(f"[organize-warning] sidecar skipped: {entry.path}: {exc}")
+        except OSError as err:
+            target = getattr(err, "filename", None) or str(current)
+            warnings.append(f"organize sidecar walk error: {target}: {err.strerror or str(err)}")
+            if verbose:
+                print(f"[organize-warning] sidecar walk error: {target}: {err.strerror or str(err)}")
 
     return sidecar_files_by_dir
 
@@ -136,14 +180,17 @@ def _move_sidecar_candidates(
     copy_instead_of_move: bool,
     verbose: bool,
     warnings: list[str],
+    preserve_metadata: bool = False,
     progress_callback: Callable[[int, int], None] | None = None,
 ) -> int:
     files_total = sum(len(files) for files in sidecar_files_by_dir.values())
     files_done = 0
+    progress_callback = throttle_progress(progress_callback, files_total)
     if progress_callback:
         progress_callback(0, files_total)
 
     sidecar_moved = 0
+    dir_devices: dict[Path, int] = {}
     for src_dir, files in sidecar_files_by_dir.items():
         dest_dir = source_to_dest.get(src_dir) or _guess_destination_dir(src_dir, destination_root)
         if dest_dir is None:
@@ -165,9 +212,9 @@ def _move_sidecar_candidates(
                         print(f"[{action}-sidecar] {candidate} -> {target}")
                     if not dry_run:
                         if copy_instead_of_move:
-                            shutil.copy2(candidate, target)
+                            _copy_file(candidate, target, preserve_metadata)
                         else:
-                            shutil.move(str(candidate), str(target))
+                            _move_file(candidate, target, dir_devices)
                     sidecar_moved += 1
                 except (FileNotFoundError, NotADirectoryError, PermissionError, OSError) as exc:
                     warnings.append(f"organize sidecar skipped: {candidate}: {exc}")
@@ -195,6 +242,7 @@ def organize_sidecar_files(
     copy_instead_of_move: bool = False,
     verbose: bool = False,
     progress_callback: Callable[[int, int], None] | None = None,
+    preserve_metadata: bool = False,
 ) -> OrganizeResult:
     warnings: list[str] = []
     sidecar_files_by_dir = _collect_sidecar_files(root, destination_root, warnings, verbose)
@@ -207,6 +255,7 @@ def organize_sidecar_files(
         verbose=verbose,
         warnings=warnings,
         progress_callback=progress_callback,
+        preserve_metadata=preserve_metadata,
     )
     return OrganizeResult(moved=0, skipped=0, sidecar_moved=sidecar_moved, warnings=warnings)
 
@@ -218,6 +267,7 @@ def organize_files(
     copy_instead_of_move: bool = False,
     verbose: bool = False,
     progress_callback: Callable[[int, int], None] | None = None,
+    preserve_metadata: bool = False,
 ) -> OrganizeResult:
     moved = 0
     skipped = 0
@@ -225,35 +275,62 @@ def organize_files(
     warnings: list[str] = []
     total = len(records)
     source_to_dest_candidates: dict[Path, dict[Path, int]] = defaultdict(lambda: defaultdict(int))
+    resolved_dirs: dict[Path, Path] = {}
+    created_dirs: set[Path] = set()
+    assigned_targets: set[Path] = set()
+    dir_devices: dict[Path, int] = {}
+
+    def _resolved_dir(directory: Path) -> Path:
+        resolved = resolved_dirs.get(directory)
+        if resolved is None:
+            resolved = directory.resolve()
+            resolved_dirs[directory] = resolved
+        return resolved
+
+    progress_callback = throttle_progress(progress_callback, total)
     if progress_callback:
         progress_callback(0, total)
 
-    for idx, record in enumerate(records, start=1):
+    defer_copies = copy_instead_of_move and not dry_run
+    pending_copies: list[tuple[TrackRecord, Path]] = []
+    done = 0
+
+    for record in records:
+        deferred = False
         try:
             target = target_path_for(record, destination_root)
 
             source_path = record.file_path
-            try:
-                same_path = source_path.resolve() == target.resolve()
-            except OSError:
-                same_path = False
+            source_dir = source_path.parent
+            if source_dir == target.parent:
+                same_path = True
+            else:
+                try:
+                    same_path = _resolved_dir(source_dir) == _resolved_dir(target.parent)
+                except OSError:
+                    same_path = False
 
             if same_path:
                 skipped += 1
                 continue
 
-            target.parent.mkdir(parents=True, exist_ok=True)
-            final_target = _non_colliding_path(target)
+            if target.parent not in created_dirs:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(target.parent)
+            final_target = _non_colliding_path(target, assigned_targets)
+            assigned_targets.add(final_target)
 
             if verbose or dry_run:
                 action = "copy" if copy_instead_of_move else "move"
                 print(f"[{action}] {source_path} -> {final_target}")
 
+            if defer_copies:
+                pending_copies.append((record, final_target))
+                deferred = True
+                continue
+
             if not dry_run:
-                if copy_instead_of_move:
-                    shutil.copy2(source_path, final_target)
-                else:
-                    shutil.move(str(source_path), str(final_target))
+                _move_file(source_path, final_target, dir_devices)
 
             moved += 1
             source_to_dest_candidates[source_path.parent][final_target.parent] += 1
@@ -263,8 +340,39 @@ def organize_files(
             if verbose:
                 print(f"[organize-warning] skipped: {rel}: {exc}")
         finally:
-            if progress_callback:
-                progress_callback(idx, total)
+            if not deferred:
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total)
+
+    if pending_copies:
+        copied = [False] * len(pending_copies)
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+            futures = {
+                executor.submit(_copy_file, record.file_path, final_target, preserve_metadata): pos
+                for pos, (record, final_target) in enumerate(pending_copies)
+            }
+            for future in as_completed(futures):
+                pos = futures[future]
+                try:
+                    future.result()
+                    copied[pos] = True
+                except (FileNotFoundError, NotADirectoryError, PermissionError, OSError) as exc:
+                    record = pending_copies[pos][0]
+                    rel = record.relative_path or str(record.file_path)
+                    warnings.append(f"organize skipped: {rel}: {exc}")
+                    if verbose:
+                        print(f"[organize-warning] skipped: {rel}: {exc}")
+                finally:
+                    done += 1
+                    if progress_callback:
+                        progress_callback(done, total)
+
+        # Tally in planning order so sidecar destinations don't depend on thread timing.
+        for (record, final_target), ok in zip(pending_copies, copied):
+            if ok:
+                moved += 1
+                source_to_dest_candidates[record.file_path.parent][final_target.parent] += 1
 
     source_to_dest: dict[Path, Path] = {}
     for src_dir, counts in source_to_dest_candidates.items():
@@ -295,6 +403,7 @@ def organize_files(
         copy_instead_of_move=copy_instead_of_move,
         verbose=verbose,
         warnings=warnings,
+        preserve_metadata=preserve_metadata,
     )
 
     return OrganizeResult(moved=moved, skipped=skipped, sidecar_moved=sidecar_moved, warnings=warnings)
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import Callable
+
+
+MAX_PROGRESS_UPDATES = 500
+
+
+def throttle_progress(
+    progress_callback: Callable[[int, int], None] | None,
+    total: int,
+    max_updates: int = MAX_PROGRESS_UPDATES,
+) -> Callable[[int, int], None] | None:
+    if progress_callback is None:
+        return None
+
+    step = max(1, total // max(1, max_updates))
+    last_reported = -step
+
+    def _report(current: int, total: int) -> None:
+        nonlocal last_reported
+        if current <= 0 or current >= total or current - last_reported >= step:
+            last_reported = current
+            progress_callback(current, total)
+
+    return _report
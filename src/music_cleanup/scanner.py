@@ -1,85 +1,143 @@
 from __future__ import annotations
 
 import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Callable
 
-from .metadata import is_audio_file, normalized_album, normalized_artist, normalized_title, read_audio_info
+from .metadata import is_audio_name, normalized_album, normalized_artist, normalized_title, read_audio_info
 from .models import ScanResult, TrackRecord
+from .progress import throttle_progress
+
+
+DEFAULT_WALK_WORKERS = 8
+# ProcessPoolExecutor rejects max_workers above 61 on Windows.
+WINDOWS_MAX_JOBS = 61
+METADATA_CHUNKSIZE = 32
+
+
+def _scan_dir(directory: str) -> tuple[list[str], list[tuple[str, int]], list[str]]:
+    subdirs: list[str] = []
+    files: list[tuple[str, int]] = []
+    errors: list[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    if is_audio_name(entry.name) and entry.is_file():
+                        files.append((entry.path, entry.stat().st_size))
+                except OSError as exc:
+                    errors.append(f"file skipped: {entry.path}: {exc}")
+    except OSError as exc:
+        target = getattr(exc, "filename", None) or directory
+        errors.append(f"walk error: {target}: {exc.strerror or str(exc)}")
+    return subdirs, files, errors
+
+
+def _walk_parallel(root: Path, num_workers: int) -> tuple[list[tuple[Path, int]], list[str]]:
+    files_found: list[tuple[str, int]] = []
+    errors_by_dir: list[tuple[str, list[str]]] = []
+
+    with ThreadPoolExecutor(max_workers=max(1, num_workers)) as executor:
+        pending: dict[Future, str] = {executor.submit(_scan_dir, str(root)): str(root)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                directory = pending.pop(future)
+                subdirs, files, errors = future.result()
+                files_found.extend(files)
+                if errors:
+                    errors_by_dir.append((directory, errors))
+                for subdir in subdirs:
+                    pending[executor.submit(_scan_dir, subdir)] = subdir
+
+    # Completion order depends on thread scheduling; sort so runs are reproducible.
+    files_found.sort()
+    errors_by_dir.sort(key=lambda item: item[0])
+    candidates = [(Path(path), size) for path, size in files_found]
+    warnings = [error for _, errors in errors_by_dir for error in errors]
+    return candidates, warnings
+
+
+def _scan_one(path: Path, size_bytes: int, root: Path) -> tuple[TrackRecord | None, str | None]:
+    try:
+        rel_path = str(path.relative_to(root))
+        metadata = read_audio_info(path)
+
+        artist = normalized_artist(str(metadata["artist"]))
+        album = normalized_album(str(metadata["album"]))
+        title = normalized_title(str(metadata["title"]), path.stem)
+
+        record = TrackRecord(
+            file_path=path,
+            relative_path=rel_path,
+            size_bytes=size_bytes,
+            format_ext=path.suffix.lower().lstrip("."),
+            artist=artist,
+            album=album,
+            title=title,
+            track_number=str(metadata["track_number"]),
+            year=str(metadata["year"]),
+            genre=str(metadata["genre"]),
+            duration_seconds=metadata["duration_seconds"],
+            bitrate_kbps=metadata["bitrate_kbps"],
+            sample_rate_hz=metadata["sample_rate_hz"],
+            metadata_source=str(metadata["metadata_source"]),
+        )
+        return record, None
+    except (FileNotFoundError, NotADirectoryError, PermissionError, OSError) as exc:
+        rel = str(path)
+        try:
+            rel = str(path.relative_to(root))
+        except ValueError:
+            pass
+        return None, f"file skipped: {rel}: {exc}"
 
 
 def scan_music(
     root: Path,
     verbose: bool = False,
     progress_callback: Callable[[int, int], None] | None = None,
+    walk_workers: int = DEFAULT_WALK_WORKERS,
+    jobs: int = 1,
 ) -> ScanResult:
     records: list[TrackRecord] = []
-    warnings: list[str] = []
-    candidates: list[Path] = []
-
-    def _on_walk_error(err: OSError) -> None:
-        target = getattr(err, "filename", None) or str(root)
-        warnings.append(f"walk error: {target}: {err.strerror or str(err)}")
-        if verbose:
-            print(f"[scan-warning] walk error: {target}: {err.strerror or str(err)}")
-
-    for dirpath, _, filenames in os.walk(root, onerror=_on_walk_error):
-        base = Path(dirpath)
-        for name in filenames:
-            path = base / name
-            try:
-                if is_audio_file(path):
-                    candidates.append(path)
-            except (FileNotFoundError, NotADirectoryError, PermissionError, OSError) as exc:
-                warnings.append(f"file skipped: {path}: {exc}")
-                if verbose:
-                    print(f"[scan-warning] file skipped: {path}: {exc}")
+    candidates, warnings = _walk_parallel(root, walk_workers)
+    if verbose:
+        for warning in warnings:
+            print(f"[scan-warning] {warning}")
 
     total = len(candidates)
+    progress_callback = throttle_progress(progress_callback, total)
     if progress_callback:
         progress_callback(0, total)
 
-    for idx, path in enumerate(candidates, start=1):
-        try:
-            rel_path = str(path.relative_to(root))
-            if verbose:
-                print(f"[scan] {rel_path}")
-
-            size_bytes = path.stat().st_size
-            metadata = read_audio_info(path)
-
-            artist = normalized_artist(str(metadata["artist"]))
-            album = normalized_album(str(metadata["album"]))
-            title = normalized_title(str(metadata["title"]), path.stem)
-
-            records.append(
-                TrackRecord(
-                    file_path=path,
-                    relative_path=rel_path,
-                    size_bytes=size_bytes,
-                    format_ext=path.suffix.lower().lstrip("."),
-                    artist=artist,
-                    album=album,
-                    title=title,
-                    track_number=str(metadata["track_number"]),
-                    year=str(metadata["year"]),
-                    genre=str(metadata["genre"]),
-                    duration_seconds=metadata["duration_seconds"],
-                    bitrate_kbps=metadata["bitrate_kbps"],
-                    sample_rate_hz=metadata["sample_rate_hz"],
-                    metadata_source=str(metadata["metadata_source"]),
-                )
-            )
-        except (FileNotFoundError, NotADirectoryError, PermissionError, OSError) as exc:
-            rel = str(path)
-            try:
-                rel = str(path.relative_to(root))
-            except ValueError:
-                pass
-            warnings.append(f"file skipped: {rel}: {exc}")
-            if verbose:
-                print(f"[scan-warning] file skipped: {rel}: {exc}")
-        finally:
+    paths = [path for path, _ in candidates]
+    sizes = [size for _, size in candidates]
+    roots = [root] * total
+    with ExitStack() as stack:
+        if sys.platform == "win32":
+            jobs = min(jobs, WINDOWS_MAX_JOBS)
+        if jobs > 1 and total > 1:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=jobs))
+            results = executor.map(_scan_one, paths, sizes, roots, chunksize=METADATA_CHUNKSIZE)
+        else:
+            results = map(_scan_one, paths, sizes, roots)
+
+        for idx, (record, warning) in enumerate(results, start=1):
+            if record is not None:
+                records.append(record)
+                if verbose:
+                    print(f"[scan] {record.relative_path}")
+            if warning is not None:
+                warnings.append(warning)
+                if verbose:
+                    print(f"[scan-warning] {warning}")
             if progress_callback:
                 progress_callback(idx, total)
 